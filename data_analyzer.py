@@ -15,7 +15,10 @@ from collections import Counter
 import json
 import os
 from wordcloud import WordCloud
-import jieba
+try:
+    import jieba_fast as jieba
+except ImportError:
+    import jieba
 from textblob import TextBlob
 import warnings
 warnings.filterwarnings('ignore')
@@ -246,16 +246,14 @@ def export_demo_data():
     df.to_csv(f'{output_dir}/demo_complaints.csv', index=False, encoding='utf-8')
     df.to_json(f'{output_dir}/demo_complaints.json', orient='records', ensure_ascii=False, indent=2)
     
-    # 按语言分组
-    for lang in df['language'].unique():
-        lang_df = df[df['language'] == lang]
+    # 按语言分组（groupby一次扫描得到所有分组）
+    for lang, lang_df in df.groupby('language', sort=False):
         lang_name = '中文' if lang == 'zh' else '英文'
         lang_df.to_csv(f'{output_dir}/demo_complaints_{lang_name}.csv', index=False, encoding='utf-8')
     
     # 按难度分组
-    for level in range(1, 6):
-        level_df = df[df['difficulty_level'] == level]
-        if not level_df.empty:
+    for level, level_df in df.groupby('difficulty_level', sort=False):
+        if 1 <= level <= 5:
             level_df.to_csv(f'{output_dir}/demo_complaints_难度{level}.csv', index=False, encoding='utf-8')
     
     print(f"✓ 演示数据导出到: {output_dir}")
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+多组关键词单遍扫描器
+一次扫描文本即可得到所有关键词组（分类、难度、情感等）的命中情况
+安装 pyahocorasick 时使用 Aho-Corasick 自动机，否则回退到预编译正则
+"""
+
+import re
+from collections import defaultdict
+from typing import Dict, Hashable, Iterable, List, Set
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+class KeywordScanner:
+    """
+    多组关键词扫描器
+    关键词统一转为小写，扫描时传入已小写的文本
+    """
+
+    def __init__(self, groups: Dict[Hashable, Iterable[str]]):
+        """
+        初始化扫描器
+
+        Args:
+            groups: 标签 -> 关键词列表，同一关键词可以属于多个标签
+        """
+        # 关键词 -> 所属标签集合
+        self._keyword_tags: Dict[str, Set[Hashable]] = defaultdict(set)
+        for tag, keywords in groups.items():
+            for keyword in keywords:
+                keyword = keyword.strip().lower()
+                if keyword:
+                    self._keyword_tags[keyword].add(tag)
+
+        self._automaton = None
+        self._pattern = None
+        if not self._keyword_tags:
+            return
+
+        if AHOCORASICK_AVAILABLE:
+            self._automaton = ahocorasick.Automaton()
+            for keyword in self._keyword_tags:
+                self._automaton.add_word(keyword, keyword)
+            self._automaton.make_automaton()
+        else:
+            # 零宽前瞻让每个位置都尝试匹配（可发现重叠命中），长词优先
+            keywords = sorted(self._keyword_tags, key=len, reverse=True)
+            self._pattern = re.compile('(?=(' + '|'.join(map(re.escape, keywords)) + '))')
+            # 同一位置只返回最长的关键词，以它为前缀的较短关键词也一并命中
+            self._prefixes: Dict[str, List[str]] = {
+                keyword: [other for other in keywords if keyword.startswith(other)]
+                for keyword in keywords
+            }
+
+    def scan(self, text_lower: str) -> Dict[Hashable, Set[str]]:
+        """
+        扫描文本
+
+        Returns:
+            标签 -> 命中的不同关键词集合（未命中的标签返回空集合）
+        """
+        found = set()
+        if self._automaton is not None:
+            for _, keyword in self._automaton.iter(text_lower):
+                found.add(keyword)
+        elif self._pattern is not None:
+            for keyword in self._pattern.findall(text_lower):
+                found.update(self._prefixes[keyword])
+
+        hits: Dict[Hashable, Set[str]] = defaultdict(set)
+        for keyword in found:
+            for tag in self._keyword_tags[keyword]:
+                hits[tag].add(keyword)
+        return hits
@@ -460,17 +460,13 @@ def export_demo_results(db_path):
     opportunities_df = pd.read_sql_query('SELECT * FROM business_opportunities ORDER BY avg_opportunity_score DESC', conn)
     opportunities_df.to_csv(f'{output_dir}/business_opportunities.csv', index=False, encoding='utf-8')
     
-    # 按痛点分类导出
-    pain_categories = complaints_df['pain_point_category'].unique()
-    for category in pain_categories:
-        category_df = complaints_df[complaints_df['pain_point_category'] == category]
+    # 按痛点分类导出（groupby一次扫描得到所有分组）
+    for category, category_df in complaints_df.groupby('pain_point_category', sort=False):
         safe_category = category.replace('/', '_')
         category_df.to_csv(f'{output_dir}/complaints_{safe_category}.csv', index=False, encoding='utf-8')
     
     # 按业务领域导出
-    sectors = complaints_df['business_sector'].unique()
-    for sector in sectors:
-        sector_df = complaints_df[complaints_df['business_sector'] == sector]
+    for sector, sector_df in complaints_df.groupby('business_sector', sort=False):
         safe_sector = sector.replace('/', '_')
         sector_df.to_csv(f'{output_dir}/complaints_{safe_sector}.csv', index=False, encoding='utf-8')
     
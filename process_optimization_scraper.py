@@ -11,6 +11,7 @@ import sys
 import time
 import random
 import json
+import re
 import sqlite3
 import pandas as pd
 from datetime import datetime, timedelta
@@ -41,6 +42,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 语言检测用的预编译正则
+_ZH_CHAR_RE = re.compile(r'[\u4e00-\u9fff]')
+_EN_CHAR_RE = re.compile(r'[a-zA-Z]')
+
 class ProcessOptimizationScraper:
     def __init__(self, use_stealth=True, headless=True, use_proxy=None):
         self.system = platform.system().lower()
@@ -262,7 +267,14 @@ class ProcessOptimizationScraper:
                 else:
                     # 传统方式
                     self.driver.get(search_url)
-                    time.sleep(3)
+                
+                # 等待推文出现，而不是固定等待
+                try:
+                    WebDriverWait(self.driver, 10).until(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, '[data-testid="tweet"]'))
+                    )
+                except TimeoutException:
+                    logger.warning(f"等待推文加载超时: {term}")
                 
                 # 滚动加载更多推文（增强版）
                 for i in range(5):  # 滚动5次
@@ -380,8 +392,8 @@ class ProcessOptimizationScraper:
     
     def detect_language(self, text):
         """检测语言"""
-        chinese_chars = len([c for c in text if '\u4e00' <= c <= '\u9fff'])
-        english_chars = len([c for c in text if c.isalpha() and ord(c) < 128])
+        chinese_chars = len(_ZH_CHAR_RE.findall(text))
+        english_chars = len(_EN_CHAR_RE.findall(text))
         
         if chinese_chars > english_chars:
             return 'zh'
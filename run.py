@@ -59,16 +59,16 @@ def run_scraper(keywords=None, max_results=50):
         scraper = XScraper()
         
         if keywords:
-            all_complaints = []
-            for keyword in keywords:
-                print(f"搜索关键词: {keyword}")
-                complaints = scraper.search_complaints(keyword, max_results=max_results)
-                all_complaints.extend(complaints)
+            all_complaints = scraper.search_many(keywords, max_results=max_results)
             
             if all_complaints:
                 scraper.save_complaints(all_complaints)
                 scraper.export_to_files()
                 print(f"✓ 成功抓取 {len(all_complaints)} 条数据")
+            elif scraper.count_complaints():
+                # 已采集过的推文会被跳过，仍导出数据库中的已有数据
+                scraper.export_to_files()
+                print("✓ 本次结果均已采集过，已重新导出已有数据")
             else:
                 print("⚠️  未找到相关数据")
         else:
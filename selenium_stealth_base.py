@@ -59,7 +59,9 @@ class StealthSeleniumBase:
                  use_stealth: bool = True,
                  use_proxy: Optional[str] = None,
                  window_size: tuple = (1920, 1080),
-                 user_data_dir: Optional[str] = None):
+                 user_data_dir: Optional[str] = None,
+                 page_load_strategy: str = 'normal',
+                 load_images: bool = True):
         """
         初始化反爬Selenium驱动
         
@@ -70,6 +72,8 @@ class StealthSeleniumBase:
             use_proxy: 代理服务器地址 (格式: host:port 或 user:pass@host:port)
             window_size: 窗口大小
             user_data_dir: Chrome用户数据目录
+            page_load_strategy: 页面加载策略 (normal: 等待页面完全加载; eager: DOMContentLoaded即返回，不等待图片等子资源)
+            load_images: 是否加载图片
         """
         self.headless = headless
         self.use_undetected = use_undetected
@@ -77,6 +81,8 @@ class StealthSeleniumBase:
         self.use_proxy = use_proxy
         self.window_size = window_size
         self.user_data_dir = user_data_dir
+        self.page_load_strategy = page_load_strategy
+        self.load_images = load_images
         self.driver = None
         self.ua = UserAgent()
         
@@ -131,9 +137,14 @@ class StealthSeleniumBase:
         options.add_argument('--disable-gpu-logging')
         options.add_argument('--silent')
         
+        # 页面加载策略
+        options.page_load_strategy = self.page_load_strategy
+        
         # 禁用图像加载以提高速度（可选）
-        # prefs = {"profile.managed_default_content_settings.images": 2}
-        # options.add_experimental_option("prefs", prefs)
+        if not self.load_images:
+            options.add_argument('--blink-settings=imagesEnabled=false')
+            prefs = {"profile.managed_default_content_settings.images": 2}
+            options.add_experimental_option("prefs", prefs)
         
         return options
     
@@ -8,31 +8,80 @@ X(Twitter) 用户吐槽和问题抓取分析工具
 
 import tweepy
 import pandas as pd
+import numpy as np
 import json
+import csv
+import hashlib
 import re
 import os
 from datetime import datetime, timedelta
 import sqlite3
 from textblob import TextBlob
-import jieba
-import jieba.analyse
+# 优先使用C扩展实现的jieba_fast（接口与jieba一致），未安装时回退到jieba
+try:
+    import jieba_fast as jieba
+    import jieba_fast.analyse
+except ImportError:
+    import jieba
+    import jieba.analyse
 from collections import Counter
+from itertools import groupby
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
 import logging
+import threading
 from typing import List, Dict, Optional
 import time
 import random
 
+from keyword_scanner import KeywordScanner
+
 # 导入反爬基础类
 try:
     from selenium_stealth_base import StealthSeleniumBase
     from selenium.webdriver.common.by import By
     from selenium.webdriver.support.ui import WebDriverWait
     from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import TimeoutException
     SELENIUM_AVAILABLE = True
 except ImportError:
     SELENIUM_AVAILABLE = False
     print("警告: Selenium相关模块未安装，将仅使用Twitter API模式")
 
+# 可选：脚本采集失败时用BeautifulSoup解析页面源码（lxml解析器更快）
+try:
+    from bs4 import BeautifulSoup
+    BS4_AVAILABLE = True
+    try:
+        import lxml  # noqa: F401
+        BS4_PARSER = 'lxml'
+    except ImportError:
+        BS4_PARSER = 'html.parser'
+except ImportError:
+    BS4_AVAILABLE = False
+
+# 可选：更快的内容哈希
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# 可选：更快的JSON序列化
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# 可选：Parquet导出
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 # 配置日志
 logging.basicConfig(
     level=logging.INFO,
@@ -44,6 +93,78 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 在页面内一次性采集所有推文字段的脚本（替代逐元素find_element）
+_COLLECT_TWEETS_JS = """
+return Array.from(document.querySelectorAll('[data-testid="tweet"]')).map(function (tweet) {
+    function text(selector) {
+        var el = tweet.querySelector(selector);
+        return el ? el.innerText : '';
+    }
+    var user = tweet.querySelector('[data-testid="User-Name"] a');
+    var status = tweet.querySelector('a[href*="/status/"]');
+    return {
+        text: text('[data-testid="tweetText"]'),
+        user: user ? user.getAttribute('href') : '',
+        status: status ? status.getAttribute('href') : '',
+        like: text('[data-testid="like"]'),
+        retweet: text('[data-testid="retweet"]'),
+        reply: text('[data-testid="reply"]')
+    };
+});
+"""
+
+# 语言检测用的预编译正则
+_ZH_CHAR_RE = re.compile(r'[\u4e00-\u9fff]')
+_EN_CHAR_RE = re.compile(r'[a-zA-Z]')
+# 互动数量中的数字及单位
+_NUM_RE = re.compile(r'\d+')
+_COUNT_SUFFIXES = {'K': 1_000, 'M': 1_000_000, 'B': 1_000_000_000}
+# 英文关键词：长度大于2的单词
+_EN_WORD_RE = re.compile(r'\w{3,}')
+# 推文永久链接中的推文ID
+_STATUS_ID_RE = re.compile(r'/status/(\d+)')
+
+# 难度关键词（按语言）
+HIGH_DIFFICULTY_KEYWORDS = {
+    'zh': ['系统', '数据库', '服务器', '网络', '算法', '架构', '集成', '兼容性', '安全', '性能'],
+    'en': ['system', 'database', 'server', 'network', 'algorithm', 'architecture', 'integration', 'compatibility', 'security', 'performance']
+}
+
+MEDIUM_DIFFICULTY_KEYWORDS = {
+    'zh': ['功能', '设置', '配置', '导入', '导出', '同步', '备份'],
+    'en': ['feature', 'setting', 'configuration', 'import', 'export', 'sync', 'backup']
+}
+
+LOW_DIFFICULTY_KEYWORDS = {
+    'zh': ['界面', '颜色', '字体', '布局', '显示'],
+    'en': ['interface', 'color', 'font', 'layout', 'display']
+}
+
+# 中文情感词
+NEGATIVE_WORDS_ZH = ['不好', '差', '烂', '垃圾', '讨厌', '失望', '糟糕', '问题', '错误', '故障']
+POSITIVE_WORDS_ZH = ['好', '棒', '优秀', '满意', '喜欢', '不错', '完美']
+
+# API搜索时附加的抱怨关键词，OR子句只拼接一次
+COMPLAINT_KEYWORDS = [
+    "问题", "bug", "错误", "故障", "不能用", "崩溃", "卡顿",
+    "problem", "issue", "error", "broken", "crash", "slow",
+    "差评", "吐槽", "抱怨", "不满", "失望",
+    "complaint", "disappointed", "frustrated", "terrible"
+]
+_COMPLAINT_CLAUSE = f"({' OR '.join(COMPLAINT_KEYWORDS)})"
+
+def _static_keyword_groups() -> Dict:
+    """难度和情感关键词组，标签形如 ('high', 'zh')、('negative', 'zh')"""
+    groups = {}
+    for tier, table in (('high', HIGH_DIFFICULTY_KEYWORDS),
+                        ('medium', MEDIUM_DIFFICULTY_KEYWORDS),
+                        ('low', LOW_DIFFICULTY_KEYWORDS)):
+        for language, keywords in table.items():
+            groups[(tier, language)] = keywords
+    groups[('negative', 'zh')] = NEGATIVE_WORDS_ZH
+    groups[('positive', 'zh')] = POSITIVE_WORDS_ZH
+    return groups
+
 class XScraper:
     def __init__(self, config_file: str = 'config.json', use_selenium: bool = False, use_stealth: bool = True):
         """初始化X抓取器"""
@@ -53,10 +174,22 @@ class XScraper:
         self.use_selenium = use_selenium and SELENIUM_AVAILABLE
         self.use_stealth = use_stealth
         self.stealth_driver = None
+        # author_id -> username，跨查询复用，避免重复获取用户信息
+        self._user_cache: Dict[int, str] = {}
+        self._conn = self._connect()
         self.setup_database()
         
-        # 设置jieba分词
-        jieba.set_dictionary('dict.txt.big')  # 使用繁体字典以支持更多中文词汇
+        # 分类/难度/情感关键词单遍扫描器
+        keyword_groups = _static_keyword_groups()
+        for category_name, category_keywords in self._categories:
+            keyword_groups[('category', category_name)] = category_keywords
+        self._scanner = KeywordScanner(keyword_groups)
+        
+        # jieba词典延迟到第一条中文推文时再加载
+        self._jieba_ready = False
+        self._jieba_lock = threading.Lock()
+        # search_many并发搜索时保护_seen_ids的检查和占用
+        self._seen_lock = threading.Lock()
         
         # 初始化Selenium（如果启用）
         if self.use_selenium:
@@ -97,9 +230,25 @@ class XScraper:
             logger.error(f"设置Twitter API失败: {e}")
             return None
     
+    def _connect(self) -> sqlite3.Connection:
+        """打开数据库连接并启用WAL写入优化和读缓存"""
+        conn = sqlite3.connect(self.db_path)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA cache_size=-262144')  # 页缓存上限256MB（按需分配）
+        conn.execute('PRAGMA temp_store=MEMORY')  # 排序/分组临时表放内存
+        conn.execute('PRAGMA mmap_size=268435456')  # 256MB内存映射读
+        return conn
+    
+    def close(self):
+        """关闭数据库连接"""
+        if self._conn:
+            self._conn.close()
+            self._conn = None
+    
     def setup_database(self):
         """设置SQLite数据库"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn
         cursor = conn.cursor()
         
         # 创建主表
@@ -123,6 +272,15 @@ class XScraper:
             )
         ''')
         
+        # 分组导出/统计用的索引，按组有序读取时无需整表排序
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_complaints_category ON complaints(category, created_at DESC)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_complaints_difficulty ON complaints(difficulty_level, created_at DESC)')
+        try:
+            # 表达式索引需要SQLite 3.9+
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_complaints_date ON complaints(DATE(created_at), created_at DESC)')
+        except sqlite3.OperationalError as e:
+            logger.warning(f"创建日期索引失败: {e}")
+        
         # 创建分类表
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS categories (
@@ -149,7 +307,19 @@ class XScraper:
         )
         
         conn.commit()
-        conn.close()
+        
+        # 分类表是静态数据，缓存到内存中，避免每条推文都查询数据库
+        # 关键词用frozenset存储，成员判断为O(1)
+        cursor.execute('SELECT name, keywords FROM categories')
+        self._categories = [
+            (name, frozenset(keyword.strip().lower() for keyword in keywords.split(',')))
+            for name, keywords in cursor.fetchall()
+        ]
+        
+        # 已入库及本次运行已处理的推文ID，重复推文在分析前直接跳过
+        cursor.execute('SELECT tweet_id FROM complaints')
+        self._seen_ids = {tweet_id for (tweet_id,) in cursor}
+        
         logger.info("数据库设置完成")
     
     def setup_selenium_driver(self):
@@ -166,7 +336,9 @@ class XScraper:
                     use_undetected=True,
                     use_stealth=True,
                     use_proxy=self.config.get('proxy', None),
-                    window_size=(1920, 1080)
+                    window_size=(1920, 1080),
+                    page_load_strategy='eager',
+                    load_images=False
                 )
                 logger.info("反爬Selenium驱动初始化成功")
                 return True
@@ -197,30 +369,49 @@ class XScraper:
                 logger.error("无法访问Twitter搜索页面")
                 return tweets
             
-            # 等待推文加载
-            time.sleep(3)
+            # 等待推文加载（出现即继续，而不是固定等待）
+            try:
+                WebDriverWait(self.stealth_driver.driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, '[data-testid="tweet"]'))
+                )
+            except TimeoutException:
+                logger.warning("等待推文加载超时")
+                return tweets
+            
+            # 时间线会回收滚出视口的推文，因此每次滚动后都采集一次，按推文ID去重
+            seen = set()
+            rows = self._collect_new_tweet_fields(seen)
             
             # 滚动加载更多推文
             for scroll_count in range(5):
+                if len(rows) >= max_results:
+                    break
+                
                 # 模拟人类滚动行为
                 self.stealth_driver.simulate_human_behavior()
                 
                 # 滚动页面
+                previous_height = self.stealth_driver.execute_script("return document.body.scrollHeight")
                 scroll_distance = random.randint(800, 1200)
                 self.stealth_driver.execute_script(f"window.scrollTo(0, {scroll_distance * (scroll_count + 1)});")
                 
-                # 随机等待
-                time.sleep(random.uniform(2, 4))
+                # 等待新内容加载，最多等待随机时长
+                self._wait_for_page_growth(previous_height, random.uniform(2, 4))
+                rows.extend(self._collect_new_tweet_fields(seen))
             
-            # 提取推文
-            tweet_elements = self.stealth_driver.driver.find_elements(By.CSS_SELECTOR, '[data-testid="tweet"]')
-            logger.info(f"找到 {len(tweet_elements)} 个推文元素")
+            logger.info(f"找到 {len(rows)} 个推文元素")
             
-            for i, tweet_element in enumerate(tweet_elements[:max_results]):
+            rows = rows[:max_results]
+            languages = self.detect_language_batch([fields.get('text') or "" for fields in rows])
+            
+            for i, (fields, language) in enumerate(zip(rows, languages)):
                 try:
-                    tweet_data = self.extract_tweet_from_element(tweet_element, query)
+                    tweet_data = self._record_from_fields(fields, language)
                     if tweet_data:
                         tweets.append(tweet_data)
+                        # 只有真正生成记录的推文才标记为已处理
+                        if fields['status_id']:
+                            self._seen_ids.add(fields['status_id'])
                         
                 except Exception as e:
                     logger.warning(f"提取第 {i+1} 个推文失败: {e}")
@@ -233,88 +424,154 @@ class XScraper:
         
         return tweets
     
-    def extract_tweet_from_element(self, tweet_element, search_query: str) -> Optional[Dict]:
-        """从推文元素提取数据"""
+    def _wait_for_page_growth(self, previous_height: int, timeout: float):
+        """等待滚动后页面高度增加（新推文加载完成），超时则直接继续"""
         try:
-            # 提取推文文本
-            try:
-                text_element = tweet_element.find_element(By.CSS_SELECTOR, '[data-testid="tweetText"]')
-                content = text_element.text
-            except:
-                content = ""
-            
-            if not content:
-                return None
-            
-            # 提取用户信息
-            try:
-                user_element = tweet_element.find_element(By.CSS_SELECTOR, '[data-testid="User-Name"] a')
-                username = user_element.get_attribute('href').split('/')[-1]
-            except:
-                username = "unknown"
-            
-            # 提取互动数据
-            like_count = self.extract_interaction_count(tweet_element, '[data-testid="like"]')
-            retweet_count = self.extract_interaction_count(tweet_element, '[data-testid="retweet"]')
-            reply_count = self.extract_interaction_count(tweet_element, '[data-testid="reply"]')
-            
-            # 生成唯一ID
-            tweet_id = f"selenium_{username}_{hash(content)}_{int(time.time())}"
-            
-            # 分析推文
-            language = self.detect_language(content)
-            keywords = self.extract_keywords(content, language)
-            difficulty = self.calculate_difficulty_level(content, language)
-            category = self.categorize_complaint(content, keywords)
-            sentiment = self.calculate_sentiment_score(content, language)
-            
-            return {
-                'tweet_id': tweet_id,
-                'user_id': username,
-                'username': username,
-                'content': content,
-                'language': language,
-                'created_at': datetime.now(),
-                'difficulty_level': difficulty,
-                'category': category,
-                'keywords': ','.join(keywords),
-                'sentiment_score': sentiment,
-                'retweet_count': retweet_count,
-                'like_count': like_count,
-                'reply_count': reply_count
-            }
-            
+            WebDriverWait(self.stealth_driver.driver, timeout, poll_frequency=0.2).until(
+                lambda driver: driver.execute_script("return document.body.scrollHeight") > previous_height
+            )
+        except TimeoutException:
+            pass
+    
+    def collect_tweet_fields(self) -> List[Dict]:
+        """一次性采集当前页面所有推文的原始字段"""
+        try:
+            # 在浏览器内一次遍历所有推文，单次往返只返回所需字段
+            return self.stealth_driver.execute_script(_COLLECT_TWEETS_JS) or []
         except Exception as e:
-            logger.warning(f"提取推文数据失败: {e}")
+            if not BS4_AVAILABLE:
+                raise
+            # 备选：取页面源码在本地解析
+            logger.warning(f"脚本采集推文失败，改为解析页面源码: {e}")
+            return self.parse_tweet_fields(self.stealth_driver.get_page_source())
+    
+    def _collect_new_tweet_fields(self, seen: set) -> List[Dict]:
+        """采集当前页面推文字段，只返回未见过的推文（seen会被更新）"""
+        new_rows = []
+        for fields in self.collect_tweet_fields():
+            status_id = fields['status_id'] = self._parse_status_id(fields.get('status'))
+            # 没有永久链接时退回用作者和内容去重
+            key = status_id or (fields.get('user'), fields.get('text'))
+            if key in seen or key in self._seen_ids:
+                continue
+            seen.add(key)
+            new_rows.append(fields)
+        return new_rows
+    
+    def parse_tweet_fields(self, html: str) -> List[Dict]:
+        """从页面源码解析推文原始字段"""
+        soup = BeautifulSoup(html, BS4_PARSER)
+        rows = []
+        for article in soup.select('[data-testid="tweet"]'):
+            def node_text(selector):
+                node = article.select_one(selector)
+                return node.get_text() if node else ""
+            
+            user_link = article.select_one('[data-testid="User-Name"] a')
+            status_link = article.select_one('a[href*="/status/"]')
+            rows.append({
+                'text': node_text('[data-testid="tweetText"]'),
+                'user': user_link.get('href', "") if user_link else "",
+                'status': status_link.get('href', "") if status_link else "",
+                'like': node_text('[data-testid="like"]'),
+                'retweet': node_text('[data-testid="retweet"]'),
+                'reply': node_text('[data-testid="reply"]')
+            })
+        return rows
+    
+    def _record_from_fields(self, fields: Dict, language: Optional[str] = None) -> Optional[Dict]:
+        """将页面采集的原始字段转换为推文记录"""
+        content = fields.get('text') or ""
+        if not content:
             return None
+        
+        user_href = fields.get('user') or ""
+        username = user_href.split('/')[-1] if user_href else "unknown"
+        
+        return self._build_selenium_record(
+            content,
+            username,
+            self._parse_interaction_count(fields.get('like') or ""),
+            self._parse_interaction_count(fields.get('retweet') or ""),
+            self._parse_interaction_count(fields.get('reply') or ""),
+            language,
+            fields.get('status_id') or self._parse_status_id(fields.get('status'))
+        )
+    
+    @staticmethod
+    def _parse_status_id(status_href: Optional[str]) -> Optional[str]:
+        """从推文永久链接中解析推文ID"""
+        match = _STATUS_ID_RE.search(status_href or "")
+        return match.group(1) if match else None
+    
+    def _build_selenium_record(self, content: str, username: str, like_count: int,
+                               retweet_count: int, reply_count: int,
+                               language: Optional[str] = None, tweet_id: Optional[str] = None) -> Dict:
+        """根据页面上提取的字段构建推文记录"""
+        # 优先使用页面上的真实推文ID，否则按作者和内容生成确定性ID（重复抓取时可去重）
+        if not tweet_id:
+            tweet_id = f"selenium_{username}_{self._content_hash(content)}"
+        
+        return {
+            'tweet_id': tweet_id,
+            'user_id': username,
+            'username': username,
+            'content': content,
+            'created_at': datetime.now(),
+            **self.analyze_content(content, language),
+            'retweet_count': retweet_count,
+            'like_count': like_count,
+            'reply_count': reply_count
+        }
+    
+    @staticmethod
+    def _content_hash(content: str) -> str:
+        """计算内容的64位哈希（跨进程稳定，不同于内置hash）"""
+        if XXHASH_AVAILABLE:
+            return xxhash.xxh3_64_hexdigest(content)
+        return hashlib.blake2b(content.encode('utf-8'), digest_size=8).hexdigest()
     
-    def extract_interaction_count(self, tweet_element, selector: str) -> int:
-        """提取互动数量"""
+    def _parse_interaction_count(self, count_text: str) -> int:
+        """解析互动数量文本（支持K、M、B单位）"""
         try:
-            count_element = tweet_element.find_element(By.CSS_SELECTOR, selector)
-            count_text = count_element.text.strip()
+            count_text = count_text.strip().upper().replace(',', '')
             
             if not count_text or count_text == '0':
                 return 0
             
             # 处理K, M等单位
-            if 'K' in count_text.upper():
-                return int(float(count_text.upper().replace('K', '')) * 1000)
-            elif 'M' in count_text.upper():
-                return int(float(count_text.upper().replace('M', '')) * 1000000)
-            else:
-                # 提取数字
-                numbers = re.findall(r'\d+', count_text)
-                return int(numbers[0]) if numbers else 0
+            multiplier = _COUNT_SUFFIXES.get(count_text[-1])
+            if multiplier:
+                return int(float(count_text[:-1]) * multiplier)
+            
+            # 提取数字
+            match = _NUM_RE.search(count_text)
+            return int(match.group()) if match else 0
                 
         except:
             return 0
     
+    def analyze_content(self, text: str, language: Optional[str] = None) -> Dict:
+        """对推文内容运行完整分析流程（语言只检测一次，并传递给各个分析步骤）"""
+        if language is None:
+            language = self.detect_language(text)
+        keywords = self.extract_keywords(text, language)
+        # 难度、分类、情感共用同一次关键词扫描结果
+        hits = self._scanner.scan(text.lower())
+        
+        return {
+            'language': language,
+            'difficulty_level': self.calculate_difficulty_level(text, language, hits),
+            'category': self.categorize_complaint(text, keywords, hits),
+            'keywords': ','.join(keywords),
+            'sentiment_score': self.calculate_sentiment_score(text, language, hits)
+        }
+    
     def detect_language(self, text: str) -> str:
         """检测文本语言"""
-        # 简单的语言检测
-        chinese_chars = len(re.findall(r'[\u4e00-\u9fff]', text))
-        english_chars = len(re.findall(r'[a-zA-Z]', text))
+        # 基于字符统计的语言检测
+        chinese_chars = len(_ZH_CHAR_RE.findall(text))
+        english_chars = len(_EN_CHAR_RE.findall(text))
         
         if chinese_chars > english_chars:
             return 'zh'
@@ -323,46 +580,68 @@ class XScraper:
         else:
             return 'unknown'
     
+    def detect_language_batch(self, texts: List[str]) -> List[str]:
+        """批量检测文本语言（规则与detect_language一致，整批一次向量化统计字符）"""
+        if not texts:
+            return []
+        
+        # 用分隔符拼接后统一转为UTF-32码点数组，每个字符对应一个元素
+        # surrogatepass：截断的emoji等孤立代理字符也按一个码点编码，避免整批失败
+        lengths = np.fromiter((len(text) for text in texts), dtype=np.int64, count=len(texts))
+        codes = np.frombuffer('\x1f'.join(texts).encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+        
+        is_zh = (codes >= 0x4E00) & (codes <= 0x9FFF)
+        is_en = ((codes >= 0x41) & (codes <= 0x5A)) | ((codes >= 0x61) & (codes <= 0x7A))
+        
+        # 前缀和相减得到每段计数（空文本也能正确处理）
+        starts = np.concatenate(([0], np.cumsum(lengths + 1)[:-1]))
+        ends = starts + lengths
+        zh_cumsum = np.concatenate(([0], np.cumsum(is_zh)))
+        en_cumsum = np.concatenate(([0], np.cumsum(is_en)))
+        chinese_chars = zh_cumsum[ends] - zh_cumsum[starts]
+        english_chars = en_cumsum[ends] - en_cumsum[starts]
+        
+        return [
+            'zh' if zh > en else ('en' if en > 0 else 'unknown')
+            for zh, en in zip(chinese_chars.tolist(), english_chars.tolist())
+        ]
+    
     def extract_keywords(self, text: str, language: str) -> List[str]:
         """提取关键词"""
         if language == 'zh':
             # 中文关键词提取
+            self._ensure_jieba()
             keywords = jieba.analyse.extract_tags(text, topK=10, withWeight=False)
         else:
-            # 英文关键词提取
-            blob = TextBlob(text.lower())
-            words = [word for word in blob.words if len(word) > 2]
-            word_freq = Counter(words)
+            # 英文关键词提取（正则分词，无需TextBlob的完整分词流程）
+            word_freq = Counter(_EN_WORD_RE.findall(text.lower()))
             keywords = [word for word, freq in word_freq.most_common(10)]
         
         return keywords
     
-    def calculate_difficulty_level(self, text: str, language: str) -> int:
+    def _ensure_jieba(self):
+        """首次需要中文分词时加载jieba词典（每个进程只加载一次）"""
+        if self._jieba_ready:
+            return
+        # search_many会在多个线程中分析推文，加锁保证词典只设置和加载一次
+        with self._jieba_lock:
+            if self._jieba_ready:
+                return
+            try:
+                jieba.set_dictionary('dict.txt.big')  # 使用繁体字典以支持更多中文词汇
+            except Exception as e:
+                logger.warning(f"jieba词典 dict.txt.big 不可用，使用默认词典: {e}")
+            jieba.initialize()
+            self._jieba_ready = True
+    
+    def calculate_difficulty_level(self, text: str, language: str, hits: Optional[Dict] = None) -> int:
         """计算问题难易程度 (1-5级)"""
-        difficulty_score = 1
-        
-        # 基于关键词判断难度
-        high_difficulty_keywords = {
-            'zh': ['系统', '数据库', '服务器', '网络', '算法', '架构', '集成', '兼容性', '安全', '性能'],
-            'en': ['system', 'database', 'server', 'network', 'algorithm', 'architecture', 'integration', 'compatibility', 'security', 'performance']
-        }
-        
-        medium_difficulty_keywords = {
-            'zh': ['功能', '设置', '配置', '导入', '导出', '同步', '备份'],
-            'en': ['feature', 'setting', 'configuration', 'import', 'export', 'sync', 'backup']
-        }
-        
-        low_difficulty_keywords = {
-            'zh': ['界面', '颜色', '字体', '布局', '显示'],
-            'en': ['interface', 'color', 'font', 'layout', 'display']
-        }
-        
-        text_lower = text.lower()
-        
-        # 检查高难度关键词
-        high_count = sum(1 for keyword in high_difficulty_keywords.get(language, []) if keyword in text_lower)
-        medium_count = sum(1 for keyword in medium_difficulty_keywords.get(language, []) if keyword in text_lower)
-        low_count = sum(1 for keyword in low_difficulty_keywords.get(language, []) if keyword in text_lower)
+        # 基于关键词判断难度：一次扫描得到各层级命中的不同关键词
+        if hits is None:
+            hits = self._scanner.scan(text.lower())
+        high_count = len(hits[('high', language)])
+        medium_count = len(hits[('medium', language)])
+        low_count = len(hits[('low', language)])
         
         if high_count >= 2:
             difficulty_score = 5
@@ -381,52 +660,38 @@ class XScraper:
         
         return difficulty_score
     
-    def categorize_complaint(self, text: str, keywords: List[str]) -> str:
+    def categorize_complaint(self, text: str, keywords: List[str], hits: Optional[Dict] = None) -> str:
         """对投诉进行分类"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('SELECT name, keywords FROM categories')
-        categories = cursor.fetchall()
-        conn.close()
-        
-        text_lower = text.lower()
-        category_scores = {}
+        if hits is None:
+            hits = self._scanner.scan(text.lower())
+        category_scores = Counter()
         
-        for category_name, category_keywords in categories:
-            score = 0
-            category_keyword_list = category_keywords.split(',')
-            
-            for keyword in category_keyword_list:
-                if keyword.strip().lower() in text_lower:
-                    score += 2
+        for category_name, category_keywords in self._categories:
+            # 文本命中分类关键词，每个计2分
+            category_scores[category_name] += 2 * len(hits[('category', category_name)])
             
             # 检查提取的关键词
-            for keyword in keywords:
-                if keyword.lower() in [ck.strip().lower() for ck in category_keyword_list]:
-                    score += 1
-            
-            category_scores[category_name] = score
+            category_scores[category_name] += sum(1 for keyword in keywords if keyword.lower() in category_keywords)
         
         # 返回得分最高的分类
         if category_scores:
-            best_category = max(category_scores, key=category_scores.get)
-            if category_scores[best_category] > 0:
+            best_category, best_score = category_scores.most_common(1)[0]
+            if best_score > 0:
                 return best_category
         
         return '其他'
     
-    def calculate_sentiment_score(self, text: str, language: str) -> float:
+    def calculate_sentiment_score(self, text: str, language: str, hits: Optional[Dict] = None) -> float:
         """计算情感分数"""
         if language == 'en':
             blob = TextBlob(text)
             return blob.sentiment.polarity
         else:
             # 简单的中文情感分析
-            negative_words = ['不好', '差', '烂', '垃圾', '讨厌', '失望', '糟糕', '问题', '错误', '故障']
-            positive_words = ['好', '棒', '优秀', '满意', '喜欢', '不错', '完美']
-            
-            negative_count = sum(1 for word in negative_words if word in text)
-            positive_count = sum(1 for word in positive_words if word in text)
+            if hits is None:
+                hits = self._scanner.scan(text.lower())
+            negative_count = len(hits[('negative', 'zh')])
+            positive_count = len(hits[('positive', 'zh')])
             
             if negative_count + positive_count == 0:
                 return 0.0
@@ -449,6 +714,38 @@ class XScraper:
             logger.error("Twitter API和Selenium都未可用")
             return []
     
+    def search_many(self, queries: List[str], max_results: int = 100, max_workers: int = 4) -> List[Dict]:
+        """批量搜索多个关键词（API模式下并发请求）"""
+        if not queries:
+            return []
+        
+        if self.use_selenium and self.stealth_driver:
+            # 单个浏览器实例只能串行访问，查询之间保持较长延迟
+            all_complaints = []
+            for i, query in enumerate(queries):
+                logger.info(f"搜索关键词: {query}")
+                all_complaints.extend(self.search_complaints(query, max_results=max_results))
+                
+                if i < len(queries) - 1:
+                    delay = random.uniform(5, 10)
+                    logger.info(f"等待 {delay:.1f} 秒...")
+                    time.sleep(delay)
+            return all_complaints
+        
+        # API请求以网络等待为主，多个关键词并发搜索；限流由tweepy的wait_on_rate_limit处理
+        def search_one(query: str) -> List[Dict]:
+            logger.info(f"搜索关键词: {query}")
+            return self.search_complaints(query, max_results=max_results)
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(queries))) as executor:
+            results = executor.map(search_one, queries)
+            # 按推文ID去重，避免同一条推文被重复统计和写入
+            unique_complaints = {}
+            for complaints in results:
+                for complaint in complaints:
+                    unique_complaints.setdefault(str(complaint['tweet_id']), complaint)
+            return list(unique_complaints.values())
+    
     def api_search_complaints(self, query: str, max_results: int = 100) -> List[Dict]:
         """使用Twitter API搜索抱怨和问题相关的推文"""
         if not self.api:
@@ -456,50 +753,53 @@ class XScraper:
             return []
         
         complaints = []
+        claimed_ids = []
         
         try:
             # 构建搜索查询
-            complaint_keywords = [
-                "问题", "bug", "错误", "故障", "不能用", "崩溃", "卡顿",
-                "problem", "issue", "error", "broken", "crash", "slow",
-                "差评", "吐槽", "抱怨", "不满", "失望",
-                "complaint", "disappointed", "frustrated", "terrible"
-            ]
-            
-            search_query = f"{query} ({' OR '.join(complaint_keywords)}) -is:retweet lang:zh OR lang:en"
+            search_query = f"{query} {_COMPLAINT_CLAUSE} -is:retweet lang:zh OR lang:en"
             
             # 搜索推文
-            tweets = tweepy.Paginator(
+            # 用户信息通过expansions随搜索结果一并返回，并缓存起来
+            tweets = []
+            for page in tweepy.Paginator(
                 self.api.search_recent_tweets,
                 query=search_query,
                 max_results=min(max_results, 100),
-                tweet_fields=['created_at', 'author_id', 'public_metrics', 'lang']
-            ).flatten(limit=max_results)
+                tweet_fields=['created_at', 'author_id', 'public_metrics', 'lang'],
+                expansions=['author_id'],
+                user_fields=['username']
+            ):
+                for user in (page.includes or {}).get('users', []):
+                    self._user_cache[user.id] = user.username
+                tweets.extend(page.data or [])
+                if len(tweets) >= max_results:
+                    break
+            tweets = tweets[:max_results]
             
+            # 过滤空推文、转发和回复，以及已处理过的推文（多个关键词常命中同一条推文）
+            new_tweets = []
             for tweet in tweets:
-                if not tweet.text:
-                    continue
-                
-                # 过滤转发和回复
-                if tweet.text.startswith('RT @') or tweet.text.startswith('@'):
+                if not tweet.text or tweet.text.startswith('RT @') or tweet.text.startswith('@'):
                     continue
-                
-                language = self.detect_language(tweet.text)
-                keywords = self.extract_keywords(tweet.text, language)
-                difficulty = self.calculate_difficulty_level(tweet.text, language)
-                category = self.categorize_complaint(tweet.text, keywords)
-                sentiment = self.calculate_sentiment_score(tweet.text, language)
-                
+                # 加锁检查并占用ID，并发查询命中同一条推文时只有一个线程会分析它
+                with self._seen_lock:
+                    if str(tweet.id) in self._seen_ids:
+                        continue
+                    self._seen_ids.add(str(tweet.id))
+                claimed_ids.append(str(tweet.id))
+                new_tweets.append(tweet)
+            tweets = new_tweets
+            languages = self.detect_language_batch([tweet.text for tweet in tweets])
+            
+            for tweet, language in zip(tweets, languages):
                 complaint_data = {
                     'tweet_id': tweet.id,
                     'user_id': tweet.author_id,
+                    'username': self._user_cache.get(tweet.author_id, ''),
                     'content': tweet.text,
-                    'language': language,
                     'created_at': tweet.created_at,
-                    'difficulty_level': difficulty,
-                    'category': category,
-                    'keywords': ','.join(keywords),
-                    'sentiment_score': sentiment,
+                    **self.analyze_content(tweet.text, language),
                     'retweet_count': tweet.public_metrics['retweet_count'] if tweet.public_metrics else 0,
                     'like_count': tweet.public_metrics['like_count'] if tweet.public_metrics else 0,
                     'reply_count': tweet.public_metrics['reply_count'] if tweet.public_metrics else 0
@@ -507,11 +807,14 @@ class XScraper:
                 
                 complaints.append(complaint_data)
                 
-                # 添加延迟以避免API限制
-                time.sleep(random.uniform(0.5, 1.5))
-                
         except Exception as e:
             logger.error(f"搜索推文时出错: {e}")
+            # 释放未生成记录的推文ID，后续查询仍可处理它们
+            recorded_ids = {str(complaint['tweet_id']) for complaint in complaints}
+            with self._seen_lock:
+                self._seen_ids.difference_update(
+                    tweet_id for tweet_id in claimed_ids if tweet_id not in recorded_ids
+                )
         
         logger.info(f"找到 {len(complaints)} 条相关推文")
         return complaints
@@ -521,81 +824,172 @@ class XScraper:
         if not complaints:
             return
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        for complaint in complaints:
-            try:
-                cursor.execute('''
+        try:
+            # 缺少username的记录补空字符串，之后直接按字段名绑定，无需构建中间元组
+            for complaint in complaints:
+                complaint.setdefault('username', '')
+            
+            # 单个事务内批量插入，语句只准备一次，提交时只同步一次
+            with self._conn:
+                self._conn.executemany('''
                     INSERT OR REPLACE INTO complaints 
                     (tweet_id, user_id, username, content, language, created_at, 
                      difficulty_level, category, keywords, sentiment_score, 
                      retweet_count, like_count, reply_count)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    complaint['tweet_id'],
-                    complaint['user_id'],
-                    complaint.get('username', ''),
-                    complaint['content'],
-                    complaint['language'],
-                    complaint['created_at'],
-                    complaint['difficulty_level'],
-                    complaint['category'],
-                    complaint['keywords'],
-                    complaint['sentiment_score'],
-                    complaint['retweet_count'],
-                    complaint['like_count'],
-                    complaint['reply_count']
-                ))
-            except Exception as e:
-                logger.error(f"保存数据时出错: {e}")
+                    VALUES (:tweet_id, :user_id, :username, :content, :language, :created_at,
+                            :difficulty_level, :category, :keywords, :sentiment_score,
+                            :retweet_count, :like_count, :reply_count)
+                ''', complaints)
+        except Exception as e:
+            logger.error(f"保存数据时出错: {e}")
+            return
         
-        conn.commit()
-        conn.close()
         logger.info(f"成功保存 {len(complaints)} 条数据")
     
+    def count_complaints(self) -> int:
+        """数据库中已保存的推文数量"""
+        return self._conn.execute('SELECT COUNT(*) FROM complaints').fetchone()[0]
+    
     def export_to_files(self, output_dir: str = 'output'):
         """导出数据到文件"""
         if not os.path.exists(output_dir):
             os.makedirs(output_dir)
         
-        conn = sqlite3.connect(self.db_path)
+        # 各导出任务互不依赖，以I/O为主，并发写入
+        export_jobs = [
+            self._export_all_csv,
+            self._export_all_json,
+            self._export_by_date,
+            self._export_by_level,
+            self._export_by_category
+        ]
+        if PYARROW_AVAILABLE:
+            export_jobs.append(self._export_all_parquet)
         
-        # 导出所有数据
-        df_all = pd.read_sql_query('SELECT * FROM complaints ORDER BY created_at DESC', conn)
-        df_all.to_csv(f'{output_dir}/all_complaints.csv', index=False, encoding='utf-8')
-        df_all.to_json(f'{output_dir}/all_complaints.json', orient='records', ensure_ascii=False, indent=2)
-        
-        # 按日期分组导出
-        df_all['date'] = pd.to_datetime(df_all['created_at']).dt.date
-        for date in df_all['date'].unique():
-            date_df = df_all[df_all['date'] == date]
-            date_str = str(date)
-            date_df.to_csv(f'{output_dir}/complaints_{date_str}.csv', index=False, encoding='utf-8')
-        
-        # 按难度等级导出
-        for level in range(1, 6):
-            level_df = df_all[df_all['difficulty_level'] == level]
-            if not level_df.empty:
-                level_df.to_csv(f'{output_dir}/complaints_level_{level}.csv', index=False, encoding='utf-8')
-        
-        # 按分类导出
-        for category in df_all['category'].unique():
-            if pd.isna(category):
-                continue
-            cat_df = df_all[df_all['category'] == category]
-            safe_category = re.sub(r'[^\w\-_\.]', '_', category)
-            cat_df.to_csv(f'{output_dir}/complaints_{safe_category}.csv', index=False, encoding='utf-8')
+        with ThreadPoolExecutor(max_workers=len(export_jobs)) as executor:
+            futures = [executor.submit(job, output_dir) for job in export_jobs]
+            for future in futures:
+                future.result()
         
-        conn.close()
         logger.info(f"数据已导出到 {output_dir} 目录")
     
+    def _export_all_csv(self, output_dir: str):
+        """导出所有数据为CSV（逐行流式写入，不构建DataFrame）"""
+        conn = self._connect()
+        try:
+            cursor = conn.execute('SELECT * FROM complaints ORDER BY created_at DESC')
+            self._write_csv(os.path.join(output_dir, 'all_complaints.csv'), cursor)
+        finally:
+            conn.close()
+    
+    def _export_all_json(self, output_dir: str):
+        """导出所有数据为JSON（逐条序列化写入，不构建DataFrame）"""
+        conn = self._connect()
+        try:
+            cursor = conn.execute('SELECT * FROM complaints ORDER BY created_at DESC')
+            columns = [column[0] for column in cursor.description]
+            with open(os.path.join(output_dir, 'all_complaints.json'), 'w', encoding='utf-8') as f:
+                f.write('[')
+                separator = '\n'
+                for row in cursor:
+                    f.write(separator)
+                    f.write(self._dump_record(dict(zip(columns, row))))
+                    separator = ',\n'
+                f.write('\n]' if separator != '\n' else ']')
+        finally:
+            conn.close()
+    
+    @staticmethod
+    def _dump_record(record: Dict) -> str:
+        """序列化单条记录，缩进与整体数组格式一致"""
+        if ORJSON_AVAILABLE:
+            text = orjson.dumps(record, option=orjson.OPT_INDENT_2).decode('utf-8')
+        else:
+            text = json.dumps(record, ensure_ascii=False, indent=2)
+        return '  ' + text.replace('\n', '\n  ')
+    
+    def _export_all_parquet(self, output_dir: str):
+        """导出所有数据为Parquet（列式压缩格式，便于后续用pandas/duckdb快速读取）"""
+        conn = self._connect()
+        try:
+            df_all = pd.read_sql_query('SELECT * FROM complaints ORDER BY created_at DESC', conn)
+        finally:
+            conn.close()
+        pq.write_table(pa.Table.from_pandas(df_all, preserve_index=False),
+                       os.path.join(output_dir, 'all_complaints.parquet'), compression='zstd')
+    
+    def _export_by_date(self, output_dir: str):
+        """按日期分组导出"""
+        self._export_grouped(
+            output_dir, 'date', 'DATE(created_at) IS NOT NULL',
+            lambda date: f'complaints_{date}.csv'
+        )
+    
+    def _export_by_level(self, output_dir: str):
+        """按难度等级导出"""
+        self._export_grouped(
+            output_dir, 'difficulty_level', 'difficulty_level BETWEEN 1 AND 5',
+            lambda level: f'complaints_level_{level}.csv'
+        )
+    
+    def _export_by_category(self, output_dir: str):
+        """按分类导出"""
+        def filename_for(category: str) -> str:
+            safe_category = re.sub(r'[^\w\-_\.]', '_', category)
+            return f'complaints_{safe_category}.csv'
+        
+        self._export_grouped(output_dir, 'category', 'category IS NOT NULL', filename_for)
+    
+    def _export_grouped(self, output_dir: str, group_column: str, where: str, filename_for):
+        """
+        按分组键流式导出：一次有序查询，逐组写入CSV，无需把整表载入内存
+        
+        Args:
+            group_column: 分组列名（date为DATE(created_at)的别名）
+            where: 过滤条件，排除不需要导出的分组
+            filename_for: 分组键 -> 文件名
+        """
+        # 每个导出线程使用独立连接
+        conn = self._connect()
+        try:
+            cursor = conn.execute(f'''
+                SELECT *, DATE(created_at) AS date
+                FROM complaints
+                WHERE {where}
+                ORDER BY {group_column}, created_at DESC
+            ''')
+            key_index = [column[0] for column in cursor.description].index(group_column)
+            
+            for key, rows in groupby(cursor, key=itemgetter(key_index)):
+                self._write_csv(os.path.join(output_dir, filename_for(key)), rows, cursor.description)
+        finally:
+            conn.close()
+    
+    @staticmethod
+    def _write_csv(path: str, rows, description=None):
+        """将查询结果写入CSV，description默认取自rows本身（游标）"""
+        if description is None:
+            description = rows.description
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow([column[0] for column in description])
+            writer.writerows(rows)
+    
     def generate_report(self) -> str:
         """生成分析报告"""
-        conn = sqlite3.connect(self.db_path)
+        # 复用长连接，所有统计查询共用同一连接
+        conn = self._conn
         
-        # 基本统计
-        total_count = pd.read_sql_query('SELECT COUNT(*) as count FROM complaints', conn).iloc[0]['count']
+        # 基本统计和情感分析统计（一次扫描完成）
+        overall_stats = pd.read_sql_query('''
+            SELECT 
+                COUNT(*) as count,
+                AVG(sentiment_score) as avg_sentiment,
+                MIN(sentiment_score) as min_sentiment,
+                MAX(sentiment_score) as max_sentiment
+            FROM complaints
+        ''', conn).iloc[0]
+        total_count = int(overall_stats['count'])
         
         # 按语言统计
         lang_stats = pd.read_sql_query('''
@@ -630,17 +1024,6 @@ class XScraper:
             LIMIT 7
         ''', conn)
         
-        # 情感分析统计
-        sentiment_stats = pd.read_sql_query('''
-            SELECT 
-                AVG(sentiment_score) as avg_sentiment,
-                MIN(sentiment_score) as min_sentiment,
-                MAX(sentiment_score) as max_sentiment
-            FROM complaints
-        ''', conn)
-        
-        conn.close()
-        
         # 生成报告
         report = f"""
 # X(Twitter) 用户吐槽分析报告
@@ -662,9 +1045,9 @@ class XScraper:
 {daily_stats.to_string(index=False)}
 
 ## 情感分析
-- 平均情感分数: {sentiment_stats.iloc[0]['avg_sentiment']:.3f}
-- 最负面分数: {sentiment_stats.iloc[0]['min_sentiment']:.3f}
-- 最正面分数: {sentiment_stats.iloc[0]['max_sentiment']:.3f}
+- 平均情感分数: {overall_stats['avg_sentiment']:.3f}
+- 最负面分数: {overall_stats['min_sentiment']:.3f}
+- 最正面分数: {overall_stats['max_sentiment']:.3f}
 
 注：情感分数范围 -1.0 (最负面) 到 1.0 (最正面)
 """
@@ -714,38 +1097,32 @@ def main():
         "Windows错误"
     ]
     
-    all_complaints = []
-    
     try:
-        for query in queries:
-            logger.info(f"搜索关键词: {query}")
-            complaints = scraper.search_complaints(query, max_results=args.max_results)
-            all_complaints.extend(complaints)
-            
-            # 延迟（Selenium模式延迟更长）
-            delay = random.uniform(5, 10) if args.selenium else random.uniform(2, 5)
-            logger.info(f"等待 {delay:.1f} 秒...")
-            time.sleep(delay)
+        all_complaints = scraper.search_many(queries, max_results=args.max_results)
         
         # 保存数据
         if all_complaints:
             scraper.save_complaints(all_complaints)
-            
-            # 导出文件
-            scraper.export_to_files()
-            
-            # 生成报告
-            report = scraper.generate_report()
-            with open('output/analysis_report.md', 'w', encoding='utf-8') as f:
-                f.write(report)
-            
-            print(f"\n🎉 抓取完成！")
-            print(f"📊 共获得 {len(all_complaints)} 条数据")
-            print(f"📁 结果保存在 output 目录")
-            print(report)
-            logger.info("抓取和分析完成！")
+        elif scraper.count_complaints():
+            # 已采集过的推文会被跳过，数据库中仍有数据时照常导出和生成报告
+            logger.info("本次结果均已采集过，导出数据库中的已有数据")
         else:
             logger.warning("未找到相关数据")
+            return
+        
+        # 导出文件
+        scraper.export_to_files()
+        
+        # 生成报告
+        report = scraper.generate_report()
+        with open('output/analysis_report.md', 'w', encoding='utf-8') as f:
+            f.write(report)
+        
+        print(f"\n🎉 抓取完成！")
+        print(f"📊 共获得 {len(all_complaints)} 条新数据")
+        print(f"📁 结果保存在 output 目录")
+        print(report)
+        logger.info("抓取和分析完成！")
             
     except KeyboardInterrupt:
         logger.info("用户中断抓取")
@@ -756,6 +1133,7 @@ def main():
         if scraper.stealth_driver:
             scraper.stealth_driver.quit()
             logger.info("Selenium驱动已关闭")
+        scraper.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file